@@ -1,27 +1,105 @@
-from langchain.prompts import PromptTemplate
+from langchain.prompts import (
+    ChatPromptTemplate,
+    HumanMessagePromptTemplate,
+    SystemMessagePromptTemplate,
+)
 from langchain.chat_models import ChatOpenAI
-from langchain.chat_models import ChatGooglePalm
 from langchain.chains import LLMChain
+from langchain.globals import set_llm_cache
+from langchain.cache import SQLiteCache
+from langchain.callbacks.base import BaseCallbackHandler
+from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
+from typing import Any, List, Optional
+import aiohttp
+import asyncio
+import functools
+import openai
 import os
 
+from constants import TEXT_DESCRIPTION
 
-text_description = "Sir Ridley Scott (born 30 November 1937) is an English filmmaker. He is best known for directing films in the science fiction, crime, and historical drama genres. His work is known for its atmospheric and highly concentrated visual style.[1][2][3] Scott has received many accolades, including the BAFTA Fellowship for lifetime achievement in 2018, two Primetime Emmy Awards, and a Golden Globe Award.[4] In 2003, he was knighted by Queen Elizabeth II.[5]\
-An alumnus of the Royal College of Art in London, Scott began his career in television as a designer and director before moving into advertising as a director of commercials. He made his film directorial debut with The Duellists (1977) and gained wider recognition with his next film, Alien (1979). Though his films range widely in setting and period, they showcase memorable imagery of urban environments, spanning 2nd-century Rome in Gladiator (2000), 12th-century Jerusalem in Kingdom of Heaven (2005), medieval England in Robin Hood (2010), ancient Memphis in Exodus: Gods and Kings (2014), contemporary Mogadishu in Black Hawk Down (2001), and the futuristic cityscapes of Blade Runner (1982) and different planets in Alien, Prometheus (2012), The Martian (2015) and Alien: Covenant (2017). Several of his films are also known for their strong female characters, such as Alien, Thelma & Louise (1991) and Napoleon (2023).[6][7]\
-Scott has been nominated for three Academy Awards for Directing for Thelma & Louise, Gladiator and Black Hawk Down.[2] Gladiator won the Academy Award for Best Picture, and he received a nomination in the same category for The Martian. In 1995, both Scott and his brother Tony received a British Academy Film Award for Outstanding British Contribution to Cinema.[8] In a 2004 BBC poll, Scott was ranked 10 on the list of most influential people in British culture.[9] Scott is also known for his work in television, having earned 10 Primetime Emmy Award nominations. He won twice, for Outstanding Television Film for the HBO film The Gathering Storm (2002) and for Outstanding Documentary or Nonfiction Special for the History Channel's Gettysburg (2011).[10] He was Emmy-nominated for RKO 281 (1999), The Andromeda Strain (2008), and The Pillars of the Earth (2010).[11]\
-"
 
-if __name__ == '__main__':
+# Static instructions go first and the per-person information last, so that
+#   repeated calls share the longest possible prompt prefix (which is what
+#   provider-side prompt caching matches on).
+summary_system_template = """You are given LinkedIn information about a person. Create:
+1. a short summary
+2. two interesting facts about them"""
+summary_human_template = """LinkedIn information:
+{information}"""
+
+
+@functools.lru_cache(maxsize=1)
+def _build_chain() -> LLMChain:
+    summary_prompt_template = ChatPromptTemplate.from_messages(
+        [
+            SystemMessagePromptTemplate.from_template(summary_system_template),
+            HumanMessagePromptTemplate.from_template(summary_human_template),
+        ]
+    )
+
+    # Identical prompts are served from the on-disk cache instead of re-calling
+    #   OpenAI, including across process restarts.
+    set_llm_cache(SQLiteCache(database_path=".langchain.db"))
+    openai_llm = ChatOpenAI(temperature=0, model="gpt-3.5-turbo", streaming=True)
+    return LLMChain(llm=openai_llm,prompt=summary_prompt_template)
+
+
+# Cap on in-flight OpenAI requests, to stay under the provider rate limit.
+MAX_CONCURRENT_REQUESTS = 5
+
+
+async def summarize(
+    texts: List[str], callbacks: Optional[List[BaseCallbackHandler]] = None
+) -> List[str]:
+    """Summarize several descriptions concurrently, preserving input order.
+
+    Tokens are streamed to callbacks via on_llm_new_token as they arrive;
+      cached prompts produce no tokens. The callbacks are shared by every
+      concurrent request, so a handler that writes tokens straight to stdout
+      only makes sense when texts has a single item.
+    """
+    chain = _build_chain()
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def one(text: str) -> str:
+        async with sem:
+            result = await chain.ainvoke(
+                {"information": text}, config={"callbacks": callbacks}
+            )
+            return result[chain.output_key]
+
+    # One keep-alive connection pool shared by every request, so only the first
+    #   call pays for the TCP/TLS handshake.
+    async with aiohttp.ClientSession() as session:
+        token = openai.aiosession.set(session)
+        try:
+            return await asyncio.gather(*(one(t) for t in texts))
+        finally:
+            openai.aiosession.reset(token)
+
+
+class _StdoutStream(StreamingStdOutCallbackHandler):
+    """Streams tokens to stdout and records whether any arrived."""
+
+    streamed = False
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.streamed = True
+        super().on_llm_new_token(token, **kwargs)
+
+
+def main() -> None:
     print("hello langchain!")
     print(os.getenv('OPENAI_API_KEY'))
+    stream = _StdoutStream()
+    [summary] = asyncio.run(summarize([TEXT_DESCRIPTION], callbacks=[stream]))
+    if stream.streamed:
+        print()
+    else:
+        # Cache hits return the summary without streaming any tokens.
+        print(summary)
 
-summary_template=" given the LinkedIn information {information} about a person I want you to create:\
-    1. a short summary\
-    2. two interesting facts about them\
-    "
 
-summary_prompt_template   = PromptTemplate.from_template(summary_template)
-#summary_prompt_template.format(information=text_description)
-
-openai_llm = ChatOpenAI(temperature=0, model="gpt-3.5-turbo")
-chain = LLMChain(llm=openai_llm,prompt=summary_prompt_template)
-print(chain.run(information=text_description))
\ No newline at end of file
+if __name__ == '__main__':
+    main()
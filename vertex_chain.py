@@ -1,26 +1,69 @@
 # Dependencies for usage example.
+from gptcache import Cache
+from gptcache.adapter.api import init_similar_cache
+from gptcache.config import Config
+from gptcache.embedding import SBERT
+from gptcache.manager import manager_factory
+from gptcache.similarity_evaluation.distance import SearchDistanceEvaluation
+from langchain.cache import GPTCache
 from langchain.chains import LLMChain
+from langchain.globals import set_llm_cache
 from langchain.prompts import PromptTemplate
 from langchain.llms import VertexAI
 from wrapper.vertex_wrapper import AllChainDetails
-import vertexai
 
+import functools
+import hashlib
 import os
 
 project_id = os.getenv("PROJECT_ID")
 location = os.getenv("LOCATION")
 model_name = os.getenv("MODEL_NAME")
 
-def call_llm()-> None: 
+def init_gptcache(cache_obj: Cache, llm: str) -> None:
+    """Semantic cache: paraphrased prompts reuse a stored completion."""
+    hashed_llm = hashlib.sha256(llm.encode()).hexdigest()
+    embedding = SBERT("all-MiniLM-L6-v2")
+    data_manager = manager_factory(
+        "sqlite,faiss",
+        data_dir=f"similar_cache_{hashed_llm}",
+        vector_params={"dimension": embedding.dimension},
+    )
+    init_similar_cache(
+        cache_obj=cache_obj,
+        embedding=embedding,
+        data_manager=data_manager,
+        evaluation=SearchDistanceEvaluation(max_distance=4.0),
+        # FAISS returns squared L2 distance d, which SearchDistanceEvaluation
+        #   scores as 4 - d. On normalized embeddings d = 2 * (1 - cosine), so
+        #   cosine >= 0.85 means d <= 0.3, i.e. a threshold of 1 - 0.3 / 4.
+        config=Config(similarity_threshold=0.925),
+    )
+
+# Built once at import, with its input variables declared explicitly.
+food_prompt = PromptTemplate(
+    template="What food pairs well with {food}?",
+    input_variables=["food"],
+    template_format="f-string",
+)
+
+@functools.lru_cache(maxsize=1)
+def _llm() -> VertexAI:
+    """One VertexAI client per process, so its gRPC channel is reused."""
+    import vertexai  # Deferred: initializes google-cloud-aiplatform on import.
+
     vertexai.init(project=project_id, location=location)
-    llm = VertexAI(model_name=model_name, temperature=0)
+    set_llm_cache(GPTCache(init_gptcache))
+    return VertexAI(model_name=model_name, temperature=0, streaming=True)
+
+def call_llm()-> None: 
+    llm = _llm()
 
     # Callback handler specified at execution time, more information given.
-    prompt_template = "What food pairs well with {food}?"
     handler = AllChainDetails()
     llm_chain = LLMChain(
         llm=llm,
-        prompt=PromptTemplate.from_template(prompt_template)
+        prompt=food_prompt
     )
     llm_chain("chocolate", callbacks=[handler])
 
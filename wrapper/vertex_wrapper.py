@@ -1,10 +1,101 @@
 # Import dependencies.
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain.schema import AgentAction, AgentFinish, Document, LLMResult
-from prettyprinter import cpprint
+from functools import lru_cache, wraps
+import atexit
+import bdb
+import io
+import logging
+import logging.handlers
+import queue
+import sys
 from typing import Any, Dict, List, Optional, Sequence, Type, Union
 from uuid import UUID
 
+# Callback output goes to the "vertex_wrapper" logger. AllChainDetails attaches
+#   a queued stdout handler on first use, so records are written by a
+#   background listener thread and the thread running the chain never blocks
+#   on terminal IO.
+logger = logging.getLogger("vertex_wrapper")
+logger.setLevel(logging.DEBUG)
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stdout is when it emits.
+
+    Keeps contextlib.redirect_stdout and pytest's output capture working.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+@lru_cache(maxsize=1)
+def _start_output() -> logging.handlers.QueueListener:
+    """Routes logger through the queue to stdout; only runs once."""
+    handler = _StdoutHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(_log_queue, handler)
+    listener.start()
+    # Drains anything still queued before the interpreter exits.
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    logger.propagate = False
+    return listener
+
+
+def _drain_output() -> None:
+    """Blocks until every queued record has been written.
+
+    Called before each breakpoint() so the context logged for it is on screen
+      before the pdb prompt.
+    """
+    _log_queue.join()
+
+
+@lru_cache(maxsize=1)
+def _cpprint():
+    """Imports prettyprinter on first use, since it is slow to import."""
+    from prettyprinter import cpprint
+
+    return cpprint
+
+
+def _pretty(contents: Any) -> str:
+    """Returns the colored pretty-printed form of contents, without a newline."""
+    buffer = io.StringIO()
+    _cpprint()(contents, stream=buffer)
+    return buffer.getvalue().rstrip("\n")
+
+
+def _log_callback_errors(callback):
+    """Logs, rather than raises, exceptions from a callback method.
+
+    Keeps a bug in the output code from propagating into the chain run.
+    """
+
+    @wraps(callback)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return callback(self, *args, **kwargs)
+        except bdb.BdbQuit:
+            # Quitting pdb at a debug_mode breakpoint should stop the run.
+            raise
+        except Exception:
+            logger.exception(
+                "Error in %s.%s", type(self).__name__, callback.__name__
+            )
+
+    return wrapper
+
+
 class Color:
     """For easier understanding and faster manipulation of printed colors."""
 
@@ -21,57 +112,78 @@ class Color:
     END = "\033[0m\x1B[0m"
 
 
+_KEY_LABEL = Color.BOLD + Color.DARKCYAN
+_DEBUG_LABEL = Color.BOLD + Color.BLUE
+
+
 class OutputFormatter:
     """Helper class to control the format of printed output from the callbacks.
 
-    If used in prod, consider reimplementing in a way that removes hardcoding
-      of where the output is written. Maybe use Python logging and then pass a
-      custom configuration?
+    All output goes through the "vertex_wrapper" logger: errors at ERROR,
+      debug_info* at DEBUG and everything else at INFO. Raise the logger's
+      level to filter it, or reconfigure its handlers to change where the
+      output is written.
     """
 
+    @staticmethod
     def heading(text: str) -> None:
-        print(f"{Color.BOLD}{text}{Color.END}")
+        logger.info(f"{Color.BOLD}{text}{Color.END}")
 
+    @staticmethod
     def key_info(text: str) -> None:
-        print(f"{Color.BOLD}{Color.DARKCYAN}{text}{Color.END}")
+        logger.info(f"{Color.BOLD}{Color.DARKCYAN}{text}{Color.END}")
 
+    @staticmethod
     def key_info_labeled(
         label: str, contents: str, contents_newlined: Optional[bool] = False
     ) -> None:
-        print(
-            f"{Color.BOLD}{Color.DARKCYAN}{label}: {Color.END}{Color.DARKCYAN}", end=""
-        )
         if contents_newlined:
             contents = contents.splitlines()
-        cpprint(f"{contents}")
-        print(f"{Color.END}", end="")
+        if isinstance(contents, (dict, list)):
+            contents = _pretty(contents)
+        logger.info(
+            f"{_KEY_LABEL}{label}: {Color.END}{Color.DARKCYAN}{contents}{Color.END}"
+        )
 
+    @staticmethod
     def debug_info(text: str) -> None:
-        print(f"{Color.BLUE}{text}{Color.END}")
+        logger.debug(f"{Color.BLUE}{text}{Color.END}")
 
+    @staticmethod
     def debug_info_labeled(
         label: str, contents: str, contents_newlined: Optional[bool] = False
     ) -> None:
-        print(f"{Color.BOLD}{Color.BLUE}{label}: {Color.END}{Color.BLUE}", end="")
         if contents_newlined:
             contents = contents.splitlines()
-        cpprint(f"{contents}")
-        print(f"{Color.END}", end="")
+        if isinstance(contents, (dict, list)):
+            contents = _pretty(contents)
+        logger.debug(
+            f"{_DEBUG_LABEL}{label}: {Color.END}{Color.BLUE}{contents}{Color.END}"
+        )
 
+    @staticmethod
+    def plain(text: str) -> None:
+        logger.info(text)
+
+    @staticmethod
     def llm_call(text: str) -> None:
-        print(f"{Color.ITALICS}{text}{Color.END}")
+        logger.info(f"{Color.ITALICS}{text}{Color.END}")
 
+    @staticmethod
     def llm_output(text: str) -> None:
-        print(f"{Color.UNDERLINE}{text}{Color.END}")
+        logger.info(f"{Color.UNDERLINE}{text}{Color.END}")
 
+    @staticmethod
     def tool_call(text: str) -> None:
-        print(f"{Color.ITALICS}{Color.PURPLE}{text}{Color.END}")
+        logger.info(f"{Color.ITALICS}{Color.PURPLE}{text}{Color.END}")
 
+    @staticmethod
     def tool_output(text: str) -> None:
-        print(f"{Color.UNDERLINE}{Color.PURPLE}{text}{Color.END}")
+        logger.info(f"{Color.UNDERLINE}{Color.PURPLE}{text}{Color.END}")
 
+    @staticmethod
     def debug_error(text: str) -> None:
-        print(f"{Color.BOLD}{Color.RED}{text}{Color.END}")
+        logger.error(f"{Color.BOLD}{Color.RED}{text}{Color.END}")
 
 
 # Actual Langchain callback handler, this produces status updates during a
@@ -115,6 +227,11 @@ class AllChainDetails(BaseCallbackHandler):
         accompanying this class.
     """
 
+    # Makes langchain re-raise exceptions from these callbacks instead of only
+    #   logging a warning. _log_callback_errors already swallows everything
+    #   except BdbQuit, so this only lets quitting pdb stop the chain.
+    raise_error = True
+
     def __init__(
         self,
         debug_mode: Optional[bool] = False,
@@ -122,7 +239,19 @@ class AllChainDetails(BaseCallbackHandler):
     ) -> None:
         self.debug_mode = debug_mode
         self.out = out
-
+        _start_output()
+        # Partial LLM output per run ID while a response streams; reported if
+        #   the LLM call fails part way through.
+        self.streamed_tokens: Dict[UUID, List[str]] = {}
+        if not debug_mode:
+            # on_text only ever outputs in debug mode, so skip it entirely.
+            self.on_text = lambda *args, **kwargs: None
+
+    def _suppressed(self) -> bool:
+        """True when the logger would drop even errors and no breakpoint can fire."""
+        return not self.debug_mode and not logger.isEnabledFor(logging.ERROR)
+
+    @_log_callback_errors
     def on_text(
         self,
         text: str,
@@ -143,108 +272,142 @@ class AllChainDetails(BaseCallbackHandler):
             self.out.debug_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
             self.out.debug_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
-            print(text)  # Langchain already agressively formats this.
+            self.out.plain(text)  # Langchain already agressively formats this.
 
+    @_log_callback_errors
     def on_llm_start(
         self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any
     ) -> None:
         """Run when langchain calls an LLM."""
-        self.out.heading(f"\n\n> Sending text to the LLM.")
-        self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
-        self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Sending text to the LLM.")
+            self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
+            self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
 
         if len(prompts) > 1:
             self.out.debug_error("prompts has multiple items.")
             self.out.debug_error("Only outputting first item in prompts.")
             if self.debug_mode:
                 self.out.debug_info_labeled("Prompts", f"{prompts}")
+                _drain_output()
                 breakpoint()
 
-        self.out.key_info(f"Text sent to LLM:")
-        self.out.llm_call(prompts[0])
+        if info:
+            self.out.key_info(f"Text sent to LLM:")
+            self.out.llm_call(prompts[0])
 
         if self.debug_mode:
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("serialized", f"{serialized}")
 
+    @_log_callback_errors
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        """Run on each new token when the LLM is streaming."""
+        self.streamed_tokens.setdefault(kwargs["run_id"], []).append(token)
+
+    @_log_callback_errors
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Run after LLM response is received by langchain."""
-        self.out.heading(f"\n\n> Received response from LLM.")
-        self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
-        self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
+        self.streamed_tokens.pop(kwargs["run_id"], None)
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Received response from LLM.")
+            self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
+            self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
 
         if len(response.generations) > 1:
             self.out.debug_error("response object has multiple generations.")
             self.out.debug_error("Only outputting first generation in response.")
             if self.debug_mode:
                 self.out.debug_info_labeled("response", f"{response}")
+                _drain_output()
                 breakpoint()
 
-        self.out.key_info(f"Text received from LLM:")
-        self.out.llm_output(response.generations[0][0].text)
+        if info:
+            self.out.key_info(f"Text received from LLM:")
+            self.out.llm_output(response.generations[0][0].text)
 
         if self.debug_mode:
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("response", f"{response}")
 
+    @_log_callback_errors
     def on_chain_start(
         self, serialized: Dict[str, Any], inputs: Dict[str, Any], **kwargs: Any
     ) -> None:
         """Run when a new chain (or subchain) is started."""
-        self.out.heading(f"\n\n> Starting new chain.")
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Starting new chain.")
 
         if "id" not in serialized.keys():
             self.out.debug_error("Missing serialized['id']")
             class_name = "Unknown -- serialized['id'] is missing"
             if self.debug_mode:
                 self.out.debug_info_labeled("serialized", f"{serialized}")
+                _drain_output()
                 breakpoint()
         else:
             class_name = ".".join(serialized["id"])
 
-        self.out.key_info_labeled(f"Chain class", f"{class_name}")
-        self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
-        self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
+        if info:
+            self.out.key_info_labeled(f"Chain class", f"{class_name}")
+            self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
+            self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
 
         if len(inputs) < 1:
-            self.out.debug.error("Chain inputs is empty.")
+            self.out.debug_error("Chain inputs is empty.")
             if self.debug_mode:
                 self.out.debug_info_labeled("inputs", f"{inputs}")
+                _drain_output()
                 breakpoint()
-        else:
+        elif info:
             self.out.key_info("Iterating through keys/values of chain inputs:")
-        for key, value in inputs.items():
-            # These keys contain mostly noise.
-            if key not in ["stop", "agent_scratchpad"]:
-                self.out.key_info_labeled(f"   {key}", f"{value}")
+            for key, value in inputs.items():
+                # These keys contain mostly noise.
+                if key not in ["stop", "agent_scratchpad"]:
+                    self.out.key_info_labeled(f"   {key}", f"{value}")
 
         if self.debug_mode:
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("inputs", f"{inputs}")
             self.out.debug_info_labeled("serialized", f"{serialized}")
 
+    @_log_callback_errors
     def on_chain_end(self, outputs: Dict[str, Any], **kwargs: Any) -> None:
         """Run when a chain completes."""
-        self.out.heading(f"\n\n> Ending chain.")
-        self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
-        self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Ending chain.")
+            self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
+            self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
 
         if len(outputs) == 0:
-            self.out.debug_errors("No chain outputs.")
+            self.out.debug_error("No chain outputs.")
             if self.debug_mode:
                 self.out.debug_info_labeled("outputs", f"{outputs}")
+                _drain_output()
                 breakpoint()
-        else:
-            outputs_keys = [*outputs.keys()]
-        for key in outputs_keys:
-            self.out.key_info_labeled(
-                f"Output {key}", f"{outputs[key]}", contents_newlined=True
-            )
+        elif info:
+            for key, value in outputs.items():
+                self.out.key_info_labeled(
+                    f"Output {key}", f"{value}", contents_newlined=True
+                )
 
         if self.debug_mode:
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("outputs", f"{outputs}")
 
+    @_log_callback_errors
     def on_tool_start(
         self,
         serialized: Dict[str, Any],
@@ -252,6 +415,8 @@ class AllChainDetails(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Run when making a call to a tool."""
+        if not self.debug_mode and not logger.isEnabledFor(logging.INFO):
+            return
         self.out.heading(f"\n\n> Using tool.")
         self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
         self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
@@ -263,25 +428,31 @@ class AllChainDetails(BaseCallbackHandler):
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("serialized", f"{serialized}")
 
+    @_log_callback_errors
     def on_tool_end(
         self,
-        output: str,
+        output: Optional[str] = None,
         color: Optional[str] = None,
         observation_prefix: Optional[str] = None,
         llm_prefix: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
         """Run on response from a tool."""
-        self.out.heading(f"\n\n> Received tool output.")
-        self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
-        self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
-        self.out.key_info_labeled(f"Tool name", f"{kwargs['name']}")
-
-        if "output" not in locals():
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Received tool output.")
+            self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
+            self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
+            self.out.key_info_labeled(f"Tool name", f"{kwargs['name']}")
+
+        if output is None:
             self.out.debug_error("No tool output.")
             if self.debug_mode:
+                _drain_output()
                 breakpoint()
-        else:
+        elif info:
             self.out.key_info("Response from tool:")
             self.out.tool_output(f"{output}")
 
@@ -290,20 +461,26 @@ class AllChainDetails(BaseCallbackHandler):
             self.out.debug_info_labeled("observation_prefix", f"{observation_prefix}")
             self.out.debug_info_labeled("llm_prefix", f"{llm_prefix}")
 
+    @_log_callback_errors
     def on_agent_action(
         self, action: AgentAction, color: Optional[str] = None, **kwargs: Any
     ) -> Any:
         """Run when agent performs an action."""
-        self.out.heading(f"\n\n> Agent taking an action.")
-        self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
-        self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Agent taking an action.")
+            self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
+            self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
 
         if not hasattr(action, "log"):
             self.out.debug_error("No log in action.")
             if self.debug_mode:
                 self.out.debug_info_labeled("action", f"{action}")
+                _drain_output()
                 breakpoint()
-        else:
+        elif info:
             self.out.key_info_labeled(
                 f"Action log", f"{action.log}", contents_newlined=True
             )
@@ -312,19 +489,25 @@ class AllChainDetails(BaseCallbackHandler):
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("action", f"{action}")
 
+    @_log_callback_errors
     def on_agent_finish(
         self, finish: AgentFinish, color: Optional[str] = None, **kwargs: Any
     ) -> None:
         """Run after agent completes."""
-        self.out.heading(f"\n\n> Agent has finished.")
-        self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
-        self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Agent has finished.")
+            self.out.key_info_labeled(f"Chain ID", f"{kwargs['run_id']}")
+            self.out.key_info_labeled("Parent chain ID", f"{kwargs['parent_run_id']}")
 
         if not hasattr(finish, "log"):
             self.out.debug_error("No log in action finish.")
             if self.debug_mode:
+                _drain_output()
                 breakpoint()
-        else:
+        elif info:
             self.out.key_info_labeled(
                 f"Action finish log", f"{finish.log}", contents_newlined=True
             )
@@ -333,30 +516,40 @@ class AllChainDetails(BaseCallbackHandler):
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("finish", f"{finish}")
 
+    @_log_callback_errors
     def on_llm_error(
         self, error: Union[Exception, KeyboardInterrupt], **kwargs: Any
     ) -> None:
         self.out.debug_error("LLM Error")
-        self.out.debug_info_labeled("Error object", f"{error}")
+        self.out.debug_error(f"Error object: {error}")
+        partial_output = self.streamed_tokens.pop(kwargs.get("run_id"), None)
+        if partial_output:
+            self.out.debug_error(f"Partial LLM output: {''.join(partial_output)}")
         if self.debug_mode:
+            _drain_output()
             breakpoint()
 
+    @_log_callback_errors
     def on_chain_error(
         self, error: Union[Exception, KeyboardInterrupt], **kwargs: Any
     ) -> None:
         self.out.debug_error("Chain Error")
-        self.out.debug_info_labeled("Error object", f"{error}")
+        self.out.debug_error(f"Error object: {error}")
         if self.debug_mode:
+            _drain_output()
             breakpoint()
 
+    @_log_callback_errors
     def on_tool_error(
         self, error: Union[Exception, KeyboardInterrupt], **kwargs: Any
     ) -> None:
         self.out.debug_error("Chain Error")
-        self.out.debug_info_labeled("Error object", f"{error}")
+        self.out.debug_error(f"Error object: {error}")
         if self.debug_mode:
+            _drain_output()
             breakpoint()
 
+    @_log_callback_errors
     def on_retriever_start(
         self,
         serialized: Dict[str, Any],
@@ -369,29 +562,36 @@ class AllChainDetails(BaseCallbackHandler):
         **kwargs: Any,
     ) -> Any:
         """Run when querying a retriever."""
-        self.out.heading(f"\n\n> Querying retriever.")
-        self.out.key_info_labeled(f"Chain ID", f"{run_id}")
-        self.out.key_info_labeled("Parent chain ID", f"{parent_run_id}")
-        self.out.key_info_labeled("Tags", f"{tags}")
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Querying retriever.")
+            self.out.key_info_labeled(f"Chain ID", f"{run_id}")
+            self.out.key_info_labeled("Parent chain ID", f"{parent_run_id}")
+            self.out.key_info_labeled("Tags", f"{tags}")
 
         if "id" not in serialized.keys():
             self.out.debug_error("Missing serialized['id']")
             class_name = "Unknown -- serialized['id'] is missing"
             if self.debug_mode:
                 self.out.debug_info_labeled("serialized", f"{serialized}")
+                _drain_output()
                 breakpoint()
         else:
             class_name = ".".join(serialized["id"])
-        self.out.key_info_labeled(f"Retriever class", f"{class_name}")
 
-        self.out.key_info(f"Query sent to retriever:")
-        self.out.tool_call(query)
+        if info:
+            self.out.key_info_labeled(f"Retriever class", f"{class_name}")
+            self.out.key_info(f"Query sent to retriever:")
+            self.out.tool_call(query)
 
         if self.debug_mode:
             self.out.debug_info_labeled("Arguments", f"{kwargs}")
             self.out.debug_info_labeled("metadata", f"{metadata}")
             self.out.debug_info_labeled("serialized", f"{serialized}")
 
+    @_log_callback_errors
     def on_retriever_end(
         self,
         documents: Sequence[Document],
@@ -401,16 +601,21 @@ class AllChainDetails(BaseCallbackHandler):
         **kwargs: Any,
     ) -> Any:
         """Run when retriever returns a response."""
-        self.out.heading(f"\n\n> Retriever finished.")
-        self.out.key_info_labeled(f"Chain ID", f"{run_id}")
-        self.out.key_info_labeled("Parent chain ID", f"{parent_run_id}")
-        self.out.key_info(f"Found {len(documents)} documents.")
+        if self._suppressed():
+            return
+        info = logger.isEnabledFor(logging.INFO)
+        if info:
+            self.out.heading(f"\n\n> Retriever finished.")
+            self.out.key_info_labeled(f"Chain ID", f"{run_id}")
+            self.out.key_info_labeled("Parent chain ID", f"{parent_run_id}")
+            self.out.key_info(f"Found {len(documents)} documents.")
 
         if len(documents) == 0:
             self.out.debug_error("No documents found.")
             if self.debug_mode:
+                _drain_output()
                 breakpoint()
-        else:
+        elif info:
             for doc_num, doc in enumerate(documents):
                 self.out.key_info("---------------------------------------------------")
                 self.out.key_info(f"Document number {doc_num} of {len(documents)}")